@@ -1,5 +1,7 @@
+import os
 from typing import Any, Dict, Optional, Tuple
 
+import jax
 import jax.numpy as jnp
 import jax.random as jrng
 import numpy as np
@@ -7,18 +9,50 @@ import numpy as np
 import gymnasium as gym
 from gymnasium import Space
 from gymnasium.envs.registration import EnvSpec
+from gymnasium.error import AlreadyPendingCallError, NoAsyncCallError
 from gymnasium.functional import ActType, FuncEnv, StateType
 from gymnasium.utils import seeding
 
 
+def _enable_persistent_compilation_cache(cache_dir: str):
+    """Stores the XLA computations compiled by jax in ``cache_dir``, so they are reused by later processes."""
+    try:
+        jax.config.update("jax_compilation_cache_dir", cache_dir)
+    except AttributeError:  # jax versions before the cache was exposed as a config option
+        from jax.experimental.compilation_cache import compilation_cache
+
+        compilation_cache.initialize_cache(cache_dir)
+
+    # By default, small or quickly compiled computations (as for most envs) are not cached
+    for option in (
+        "jax_persistent_cache_min_entry_size_bytes",
+        "jax_persistent_cache_min_compile_time_secs",
+    ):
+        try:
+            jax.config.update(option, 0)
+        except AttributeError:
+            pass
+
+
+if "GYM_JAX_CACHE" in os.environ:
+    _enable_persistent_compilation_cache(os.environ["GYM_JAX_CACHE"])
+
+
 class JaxEnv(gym.Env):
     """
     A conversion layer for numpy-based environments.
+
+    The reset and step of the functional environment are each jit-compiled on first use. Set the ``GYM_JAX_CACHE``
+    environment variable to a directory, before importing this module, to persist the compiled computations there
+    so that later processes skip the compilation.
     """
 
     state: StateType
     rng: jrng.PRNGKey
 
+    # Number of keys split off ``rng`` at once, see :meth:`_next_key`
+    _key_buffer_size: int = 1024
+
     def __init__(
         self,
         func_env: FuncEnv,
@@ -40,7 +74,20 @@ class JaxEnv(gym.Env):
         self.reward_range = reward_range
         self.spec = spec
 
+        # The action space type is resolved once here, rather than on every step
         self._is_box_action_space = isinstance(self.action_space, gym.spaces.Box)
+        if isinstance(self.action_space, gym.spaces.Box):
+            # Kept on device, actions are clipped within the jitted step
+            self._action_low = jnp.asarray(self.action_space.low)
+            self._action_high = jnp.asarray(self.action_space.high)
+            self._action_dtype = self.action_space.dtype
+        elif isinstance(self.action_space, gym.spaces.Discrete):
+            self._action_start = int(self.action_space.start)
+            self._action_stop = self._action_start + int(self.action_space.n)
+
+        # Fuse the functional calls of a reset and a step so each is a single XLA dispatch
+        self._jit_reset = jax.jit(self._reset_fn)
+        self._jit_step = jax.jit(self._step_fn)
 
         if self.render_mode == "rgb_array":
             self.render_state = self.func_env.render_init()
@@ -51,50 +98,135 @@ class JaxEnv(gym.Env):
         seed = np_random.integers(0, 2**32 - 1, dtype="uint32")
 
         self.rng = jrng.PRNGKey(seed)
+        self._key_buffer: Optional[np.ndarray] = None
+        self._key_index = 0
+
+        self._pending_step: Optional[tuple] = None
 
     def reset(self, *, seed: Optional[int] = None, options: Optional[dict] = None):
         super().reset(seed=seed)
         if seed is not None:
             self.rng = jrng.PRNGKey(seed)
+            self._key_buffer = None
+        self._pending_step = None
 
-        rng, self.rng = jrng.split(self.rng)
+        rng = self._next_key()
 
-        self.state = self.func_env.initial(rng=rng)
-        obs = self.func_env.observation(self.state)
-        info = self.func_env.state_info(self.state)
+        self.state, obs, info = self._jit_reset(rng)
 
         obs = _convert_jax_to_numpy(obs)
 
         return obs, info
 
     def step(self, action: ActType):
+        self.step_async(action)
+        return self.step_wait()
+
+    def step_async(self, action: ActType):
+        """Dispatches a step with ``action`` to the device, without waiting for its results.
+
+        Other host-side work (e.g. computing the next action) can run until :meth:`step_wait` is called.
+
+        Wrappers (e.g. ``TimeLimit``, ``OrderEnforcing`` or the env checker) only wrap :meth:`step`, accessing this
+        method through a wrapper forwards it to the base environment and bypasses them. Call it on ``env.unwrapped``
+        and apply any wrapper logic, like truncation, manually.
+
+        Raises:
+            AlreadyPendingCallError: If the results of a previous call to :meth:`step_async` were not collected
+        """
+        if self._pending_step is not None:
+            raise AlreadyPendingCallError(
+                "Calling `step_async` while waiting for a pending call to `step` to complete",
+                "step",
+            )
+
         if self._is_box_action_space:
-            assert isinstance(self.action_space, gym.spaces.Box)  # For typing
-            action = np.clip(action, self.action_space.low, self.action_space.high)
+            # Clipping happens in `_step_fn`, which requires an array rather than a list of floats
+            if not isinstance(action, (np.ndarray, jnp.ndarray)):
+                action = np.asarray(action, dtype=self._action_dtype)
         else:  # Discrete
             # For now we assume jax envs don't use complex spaces
-            err_msg = f"{action!r} ({type(action)}) invalid"
-            assert self.action_space.contains(action), err_msg
+            assert self._discrete_action_contains(
+                action
+            ), f"{action!r} ({type(action)}) invalid"
 
-        rng, self.rng = jrng.split(self.rng)
+        rng = self._next_key()
 
-        next_state = self.func_env.transition(self.state, action, rng)
-        observation = self.func_env.observation(self.state)
-        reward = self.func_env.reward(self.state, action, next_state)
-        terminated = self.func_env.terminal(next_state)
-        info = self.func_env.step_info(self.state, action, next_state)
+        next_state, observation, reward, terminated, info = self._jit_step(
+            self.state, action, rng
+        )
         self.state = next_state
+        self._pending_step = (observation, reward, terminated, info)
+
+    def step_wait(self):
+        """Waits for the step dispatched by :meth:`step_async` and returns its results, as :meth:`step` does.
+
+        Like :meth:`step_async`, this bypasses any wrappers, so call it on ``env.unwrapped``. In particular,
+        ``truncated`` is always ``False`` as the ``TimeLimit`` wrapper is not applied.
 
-        observation = _convert_jax_to_numpy(observation)
+        Raises:
+            NoAsyncCallError: If there is no prior call to :meth:`step_async`
+        """
+        if self._pending_step is None:
+            raise NoAsyncCallError(
+                "Calling `step_wait` without any prior call to `step_async`.", "step"
+            )
+        observation, reward, terminated, info = self._pending_step
+        self._pending_step = None
+
+        # The observation, reward and termination are fetched from the device in a single transfer
+        observation, reward, terminated = _convert_jax_to_numpy(
+            (observation, reward, terminated)
+        )
 
         return observation, float(reward), bool(terminated), False, info
 
+    def _discrete_action_contains(self, action: Any) -> bool:
+        """Checks a discrete action, comparing python and numpy integers directly against the bounds."""
+        if isinstance(action, (int, np.integer)):
+            return self._action_start <= action < self._action_stop
+        return self.action_space.contains(action)
+
+    def _next_key(self) -> np.ndarray:
+        """Returns a fresh rng key, splitting :attr:`_key_buffer_size` keys off ``rng`` at a time.
+
+        The keys are kept on the host so that taking the next one does not dispatch any jax computation.
+        """
+        if self._key_buffer is None or self._key_index >= len(self._key_buffer):
+            keys = jrng.split(self.rng, self._key_buffer_size + 1)
+            self.rng = keys[0]
+            self._key_buffer = np.asarray(keys[1:])
+            self._key_index = 0
+
+        key = self._key_buffer[self._key_index]
+        self._key_index += 1
+        return key
+
+    def _reset_fn(self, rng: Any):
+        """The functional reset pipeline, compiled as a whole by :attr:`_jit_reset`."""
+        state = self.func_env.initial(rng=rng)
+        obs = self.func_env.observation(state)
+        info = self.func_env.state_info(state)
+        return state, obs, info
+
+    def _step_fn(self, state: StateType, action: ActType, rng: Any):
+        """The functional step pipeline, compiled as a whole by :attr:`_jit_step`."""
+        if self._is_box_action_space:
+            action = jnp.clip(action, self._action_low, self._action_high)
+        next_state = self.func_env.transition(state, action, rng)
+        observation = self.func_env.observation(next_state)
+        reward = self.func_env.reward(state, action, next_state)
+        terminated = self.func_env.terminal(next_state)
+        info = self.func_env.step_info(state, action, next_state)
+        return next_state, observation, reward, terminated, info
+
     def render(self):
         if self.render_mode == "rgb_array":
             self.render_state, image = self.func_env.render_image(
                 self.state, self.render_state
             )
-            return image
+            # Frames drawn on the host pass through unchanged, frames drawn with jax are fetched from the device
+            return _convert_jax_to_numpy(image)
         else:
             raise NotImplementedError
 
@@ -108,14 +240,7 @@ def _convert_jax_to_numpy(element: Any):
     """
     Convert a jax observation/action to a numpy array, or a numpy-based container.
     Currently required because all tests assume that stuff is in numpy arrays, hopefully will be removed soon.
+
+    The element is treated as a pytree, so all the device arrays in a container are fetched in a single batched transfer.
     """
-    if isinstance(element, jnp.ndarray):
-        return np.asarray(element)
-    elif isinstance(element, tuple):
-        return tuple(_convert_jax_to_numpy(e) for e in element)
-    elif isinstance(element, list):
-        return [_convert_jax_to_numpy(e) for e in element]
-    elif isinstance(element, dict):
-        return {k: _convert_jax_to_numpy(v) for k, v in element.items()}
-    else:
-        raise TypeError(f"Cannot convert {element} to numpy")
+    return jax.device_get(element)
@@ -5,6 +5,9 @@ import gymnasium as gym
 from gymnasium import ActionWrapper
 from gymnasium.spaces import Box
 
+# Below this many elements, np.clip is faster with bound arrays than with scalar bounds
+_SCALAR_BOUNDS_MIN_SIZE = 4096
+
 
 class ClipAction(ActionWrapper):
     """Clip the continuous action within the valid :class:`Box` observation space bound.
@@ -28,6 +31,19 @@ class ClipAction(ActionWrapper):
         assert isinstance(env.action_space, Box)
         super().__init__(env)
 
+        self._low = np.asarray(env.action_space.low)
+        self._high = np.asarray(env.action_space.high)
+        self._action_shape = env.action_space.shape
+        # Large actions are clipped faster against uniform bounds (e.g. -1 to 1 in every dimension) as scalars
+        if (
+            self._low.size > 0
+            and np.all(self._low == self._low.flat[0])
+            and np.all(self._high == self._high.flat[0])
+        ):
+            self._scalar_bounds = (self._low.flat[0], self._high.flat[0])
+        else:
+            self._scalar_bounds = None
+
     def action(self, action):
         """Clips the action within the valid bounds.
 
@@ -37,4 +53,12 @@ class ClipAction(ActionWrapper):
         Returns:
             The clipped action
         """
-        return np.clip(action, self.action_space.low, self.action_space.high)
+        # Scalar bounds don't broadcast the action, so are only used for actions of the action space's shape
+        if (
+            self._scalar_bounds is not None
+            and isinstance(action, np.ndarray)
+            and action.size >= _SCALAR_BOUNDS_MIN_SIZE
+            and action.shape == self._action_shape
+        ):
+            return np.clip(action, *self._scalar_bounds)
+        return np.clip(action, self._low, self._high)
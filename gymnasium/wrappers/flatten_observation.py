@@ -1,6 +1,12 @@
 """Wrapper for flattening observations of an environment."""
+from functools import partial
+from typing import Any, Callable
+
+import numpy as np
+
 import gymnasium as gym
 from gymnasium import spaces
+from gymnasium.vector.utils import batch_space, concatenate, create_empty_array, iterate
 
 
 class FlattenObservation(gym.ObservationWrapper):
@@ -17,16 +23,39 @@ class FlattenObservation(gym.ObservationWrapper):
         >>> obs, info = env.reset()
         >>> obs.shape
         (27648,)
+
+    ``Box`` and ``MultiBinary`` observations that are already contiguous and of the space's dtype are flattened
+    without a copy, so the flattened observation shares memory with the environment's observation.
+
+    For vector environments, each sub-environment observation is flattened, keeping the leading batch dimension.
+    With ``copy=False``, batched observations that must be concatenated (i.e. from ``Dict`` or ``Tuple`` spaces)
+    are written into an array that is reused between steps, so the observation must be copied if it is kept
+    after the next step.
     """
 
-    def __init__(self, env: gym.Env):
+    def __init__(self, env: gym.Env, copy: bool = True):
         """Flattens the observations of an environment.
 
         Args:
             env: The environment to apply the wrapper
+            copy: For vector environments, if to return a new array for each concatenated observation,
+                otherwise a single array is reused between steps
         """
         super().__init__(env)
-        self.observation_space = spaces.flatten_space(env.observation_space)
+        self.is_vector_env = getattr(env, "is_vector_env", False)
+        if self.is_vector_env:
+            self.single_observation_space = spaces.flatten_space(
+                env.single_observation_space
+            )
+            self.observation_space = batch_space(
+                self.single_observation_space, env.num_envs
+            )
+            self._flatten = _make_batched_flatten(
+                env.single_observation_space, env.num_envs, copy
+            )
+        else:
+            self.observation_space = spaces.flatten_space(env.observation_space)
+            self._flatten = _make_flatten(env.observation_space)
 
     def observation(self, observation):
         """Flattens an observation.
@@ -37,4 +66,70 @@ class FlattenObservation(gym.ObservationWrapper):
         Returns:
             The flattened observation
         """
-        return spaces.flatten(self.env.observation_space, observation)
+        return self._flatten(observation)
+
+
+def _make_flatten(space: spaces.Space) -> Callable[[Any], Any]:
+    """Returns a function equivalent to :func:`spaces.flatten` for ``space``, with the dispatch on the space type done once.
+
+    Args:
+        space: The space of the samples to flatten
+
+    Returns:
+        A function flattening a single sample of ``space``
+    """
+    if isinstance(space, (spaces.Box, spaces.MultiBinary)):
+        dtype = space.dtype
+        # Unlike `flatten()`, `reshape` returns a view rather than a copy for contiguous observations
+        return lambda x: np.asarray(x, dtype=dtype).reshape(-1)
+    elif isinstance(space, spaces.Dict) and space.is_np_flattenable:
+        key_fns = [(key, _make_flatten(s)) for key, s in space.spaces.items()]
+        return lambda x: np.concatenate([fn(x[key]) for key, fn in key_fns])
+    elif isinstance(space, spaces.Tuple) and space.is_np_flattenable:
+        fns = [_make_flatten(s) for s in space.spaces]
+        return lambda x: np.concatenate([fn(x_part) for fn, x_part in zip(fns, x)])
+    else:
+        return partial(spaces.flatten, space)
+
+
+def _make_batched_flatten(
+    space: spaces.Space, n: int, copy: bool = True
+) -> Callable[[Any], Any]:
+    """Returns a function flattening a batch of ``n`` samples of ``space`` (as produced by a vector environment) at once.
+
+    Args:
+        space: The space of a single sample
+        n: The number of samples in a batch
+        copy: If to concatenate each batch into a new array, otherwise an array allocated once is reused
+
+    Returns:
+        A function flattening each sample in a batch, keeping the batch dimension
+    """
+    if isinstance(space, (spaces.Box, spaces.MultiBinary)):
+        dtype = space.dtype
+        return lambda x: np.asarray(x, dtype=dtype).reshape(n, -1)
+
+    flat_space = spaces.flatten_space(space)
+    out = None if copy else create_empty_array(flat_space, n, fn=np.empty)
+    if isinstance(space, spaces.Dict) and space.is_np_flattenable:
+        # The flattened subspaces are consumed by the concatenation, so can always reuse their arrays
+        key_fns = [
+            (key, _make_batched_flatten(s, n, copy=False))
+            for key, s in space.spaces.items()
+        ]
+        return lambda x: np.concatenate(
+            [fn(x[key]) for key, fn in key_fns], axis=1, out=out
+        )
+    elif isinstance(space, spaces.Tuple) and space.is_np_flattenable:
+        fns = [_make_batched_flatten(s, n, copy=False) for s in space.spaces]
+        return lambda x: np.concatenate(
+            [fn(x_part) for fn, x_part in zip(fns, x)], axis=1, out=out
+        )
+    else:
+        # Flatten each sample on its own, then batch them together again
+        batched_space = batch_space(space, n)
+        return lambda x: concatenate(
+            flat_space,
+            [spaces.flatten(space, x_part) for x_part in iterate(batched_space, x)],
+            create_empty_array(flat_space, n, fn=np.empty) if out is None else out,
+        )
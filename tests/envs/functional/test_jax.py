@@ -4,8 +4,13 @@ import jax.random as jrng
 import numpy as np
 import pytest
 
+import gymnasium
 from gymnasium.envs.phys2d.cartpole import CartPoleF  # noqa: E402
+from gymnasium.envs.phys2d.conversion import JaxEnv
 from gymnasium.envs.phys2d.pendulum import PendulumF  # noqa: E402
+from gymnasium.error import AlreadyPendingCallError, NoAsyncCallError
+from gymnasium.functional import FuncEnv
+from gymnasium.spaces import Box
 
 
 @pytest.mark.parametrize("env_class", [CartPoleF, PendulumF])
@@ -103,3 +108,119 @@ def test_vmap(env_class):
         assert obs.dtype == jnp.float32
 
         state = next_state
+
+
+@pytest.mark.parametrize("env_id", ["CartPoleJax-v1", "PendulumJax-v0"])
+def test_jax_env_step_observation(env_id):
+    env = gymnasium.make(env_id, disable_env_checker=True).unwrapped
+    env.reset(seed=0)
+    env.action_space.seed(0)
+
+    for t in range(10):
+        obs, reward, terminated, truncated, info = env.step(env.action_space.sample())
+
+        assert isinstance(obs, np.ndarray)
+        assert np.allclose(obs, env.func_env.observation(env.state))
+        assert isinstance(reward, float)
+        assert isinstance(terminated, bool)
+
+
+@pytest.mark.parametrize("env_id", ["CartPoleJax-v1", "PendulumJax-v0"])
+def test_jax_env_step_async(env_id):
+    env = gymnasium.make(env_id, disable_env_checker=True).unwrapped
+    sync_env = gymnasium.make(env_id, disable_env_checker=True).unwrapped
+    env.reset(seed=0)
+    sync_env.reset(seed=0)
+    env.action_space.seed(0)
+
+    with pytest.raises(NoAsyncCallError):
+        env.step_wait()
+
+    for t in range(10):
+        action = env.action_space.sample()
+        env.step_async(action)
+        with pytest.raises(AlreadyPendingCallError):
+            env.step_async(action)
+        obs, reward, terminated, truncated, info = env.step_wait()
+
+        sync_obs, sync_reward, sync_terminated, _, _ = sync_env.step(action)
+        assert np.allclose(obs, sync_obs)
+        assert reward == sync_reward
+        assert terminated == sync_terminated
+
+
+def test_jax_env_key_buffer_reproducibility():
+    env = gymnasium.make("CartPoleJax-v1", disable_env_checker=True).unwrapped
+    num_steps = env._key_buffer_size + 100
+    actions = np.random.default_rng(0).integers(0, 2, size=num_steps)
+
+    def rollout():
+        observations = [env.reset(seed=123)[0]]
+        for action in actions:
+            obs, reward, terminated, truncated, info = env.step(int(action))
+            observations.append(obs)
+            if terminated:
+                # Unseeded resets draw their initial state from the key buffer
+                observations.append(env.reset()[0])
+        return np.stack(observations)
+
+    first_rollout = rollout()
+    # The buffer was refilled during the rollout and is only partly consumed, so reseeding must discard it
+    assert 0 < env._key_index < env._key_buffer_size
+    second_rollout = rollout()
+
+    assert len(first_rollout) > num_steps
+    assert np.all(first_rollout == second_rollout)
+
+
+@pytest.mark.parametrize(
+    "action", [np.array([50.0]), [50.0], 50.0, np.array([50.0], dtype=np.float64)]
+)
+def test_jax_env_clips_box_actions(action):
+    env = gymnasium.make("PendulumJax-v0", disable_env_checker=True).unwrapped
+
+    env.reset(seed=0)
+    clipped_obs, clipped_reward, _, _, _ = env.step(np.array([2.0], dtype=np.float32))
+
+    env.reset(seed=0)
+    obs, reward, _, _, _ = env.step(action)
+
+    assert np.all(obs == clipped_obs)
+    assert reward == clipped_reward
+
+
+class ActionEchoFuncEnv(FuncEnv):
+    """A functional env whose state is the last action, without any clipping of its own."""
+
+    def initial(self, rng):
+        return jnp.zeros(2, dtype=jnp.float32)
+
+    def transition(self, state, action, rng):
+        return jnp.asarray(action, dtype=jnp.float32)
+
+    def observation(self, state):
+        return state
+
+    def reward(self, state, action, next_state):
+        return 0.0
+
+    def terminal(self, state):
+        return False
+
+
+@pytest.mark.parametrize("action", [np.array([5.0, -5.0]), [5.0, -5.0], 5.0])
+def test_jax_env_clips_actions_before_transition(action):
+    action_space = Box(np.array([-1, 0]), np.array([1, 2]), dtype=np.float32)
+    env = JaxEnv(
+        ActionEchoFuncEnv(),
+        observation_space=Box(-np.inf, np.inf, shape=(2,), dtype=np.float32),
+        action_space=action_space,
+    )
+    env.reset(seed=0)
+
+    obs, _, _, _, _ = env.step(action)
+    assert np.all(
+        obs
+        == np.clip(np.broadcast_to(action, (2,)), action_space.low, action_space.high)
+    )
+    assert action_space.contains(obs)
@@ -1,7 +1,12 @@
+import array
+
 import numpy as np
+import pytest
 
 import gymnasium as gym
+from gymnasium.spaces import Box
 from gymnasium.wrappers import ClipAction
+from tests.testing_env import GenericTestEnv
 
 
 def test_clip_action():
@@ -26,3 +31,90 @@ def test_clip_action():
         assert np.allclose(obs1, obs2)
         assert ter1 == ter2
         assert trunc1 == trunc2
+
+
+def test_vector_clip_action():
+    num_envs = 3
+    envs = gym.vector.SyncVectorEnv(
+        [
+            lambda: gym.make("MountainCarContinuous-v0", disable_env_checker=True)
+            for _ in range(num_envs)
+        ]
+    )
+    wrapped_envs = ClipAction(envs)
+
+    actions = np.array([[0.4], [1.2], [-2.5]], dtype=np.float32)
+    clipped_actions = wrapped_envs.action(actions)
+    assert clipped_actions.shape == (num_envs, 1)
+    assert np.allclose(
+        clipped_actions, np.clip(actions, envs.action_space.low, envs.action_space.high)
+    )
+
+
+@pytest.mark.parametrize(
+    "action_space",
+    [
+        Box(-1, 1, shape=(3,)),
+        Box(np.array([-1, -2, 0]), np.array([1, 0, 5]), dtype=np.float32),
+    ],
+)
+def test_clip_action_bounds(action_space):
+    env = ClipAction(GenericTestEnv(action_space=action_space))
+
+    action = np.array([-4.0, 0.5, 6.0], dtype=np.float32)
+    clipped_action = env.action(action)
+    assert clipped_action.shape == action_space.shape
+    assert np.all(
+        clipped_action == np.clip(action, action_space.low, action_space.high)
+    )
+    assert action_space.contains(clipped_action)
+
+
+def test_clip_action_does_not_modify_input():
+    env = ClipAction(GenericTestEnv(action_space=Box(-1, 1, shape=(3,))))
+
+    buffer = array.array("d", [5, -5, 0.5])
+    clipped_action = env.action(buffer)
+    assert np.all(clipped_action == np.array([1, -1, 0.5], dtype=np.float32))
+    assert list(buffer) == [5, -5, 0.5]
+
+    action = [5.0, -5.0, 0.5]
+    env.action(action)
+    assert action == [5.0, -5.0, 0.5]
+
+
+@pytest.mark.parametrize(
+    "action_space, expected_action",
+    [
+        (Box(-1, 1, shape=(3,)), [1, 1, 1]),
+        (Box(np.array([-1, -2, 0]), np.array([1, 0, 5]), dtype=np.float32), [1, 0, 3]),
+    ],
+)
+@pytest.mark.parametrize("action", [3.0, np.float32(3.0), np.array(3.0)])
+def test_clip_action_broadcasts_to_bounds(action_space, expected_action, action):
+    env = ClipAction(GenericTestEnv(action_space=action_space))
+
+    clipped_action = env.action(action)
+    assert clipped_action.shape == (3,)
+    assert np.all(clipped_action == np.array(expected_action, dtype=np.float32))
+
+
+def test_clip_action_scalar_step():
+    env = ClipAction(gym.make("MountainCarContinuous-v0", disable_env_checker=True))
+    env.reset(seed=0)
+
+    obs, _, _, _, _ = env.step(3.0)
+    assert env.observation_space.contains(obs)
+
+
+def test_clip_action_large_uniform_bounds():
+    action_space = Box(-1, 1, shape=(1024, 17))
+    env = ClipAction(GenericTestEnv(action_space=action_space))
+
+    action = np.random.default_rng(0).normal(scale=2, size=(1024, 17))
+    action = action.astype(np.float32)
+    clipped_action = env.action(action)
+    assert clipped_action.shape == action_space.shape
+    assert clipped_action.dtype == np.float32
+    assert np.all(clipped_action == np.clip(action, -1, 1))
+    assert action_space.contains(clipped_action)
@@ -3,7 +3,11 @@ import pytest
 
 import gymnasium as gym
 from gymnasium import spaces
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector.utils import iterate
 from gymnasium.wrappers import FlattenObservation
+from tests.spaces.utils import TESTING_SPACES, TESTING_SPACES_IDS
+from tests.testing_env import GenericTestEnv
 
 
 @pytest.mark.parametrize("env_id", ["Blackjack-v1"])
@@ -21,3 +25,74 @@ def test_flatten_observation(env_id):
     assert wrapped_space.contains(wrapped_obs)
     assert isinstance(info, dict)
     assert isinstance(wrapped_obs_info, dict)
+
+
+@pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
+def test_flatten_observation_equivalence(space):
+    env = FlattenObservation(GenericTestEnv(observation_space=space))
+
+    sample = space.sample()
+    flattened = env.observation(sample)
+    assert data_equivalence(flattened, spaces.flatten(space, sample))
+    if isinstance(flattened, np.ndarray):
+        assert flattened.dtype == env.observation_space.dtype
+
+
+@pytest.mark.parametrize(
+    "space",
+    [
+        space
+        for space in TESTING_SPACES
+        if isinstance(spaces.flatten_space(space), spaces.Box)
+    ],
+    ids=str,
+)
+def test_vector_flatten_observation(space):
+    num_envs = 3
+    envs = gym.vector.SyncVectorEnv(
+        [lambda: GenericTestEnv(observation_space=space) for _ in range(num_envs)]
+    )
+    wrapped_envs = FlattenObservation(envs)
+    assert wrapped_envs.single_observation_space == spaces.flatten_space(space)
+
+    obs, _ = envs.reset(seed=123)
+    flattened = wrapped_envs.observation(obs)
+    assert wrapped_envs.observation_space.contains(flattened)
+    for i, sub_obs in enumerate(iterate(envs.observation_space, obs)):
+        assert data_equivalence(flattened[i], spaces.flatten(space, sub_obs))
+
+
+def test_flatten_observation_view():
+    space = spaces.Box(0, 255, shape=(96, 96, 3), dtype=np.uint8)
+    env = FlattenObservation(GenericTestEnv(observation_space=space))
+
+    obs = space.sample()
+    flattened = env.observation(obs)
+    assert flattened.shape == (96 * 96 * 3,)
+    assert np.shares_memory(flattened, obs)
+
+    # Non-contiguous observations are still flattened correctly, with a copy
+    obs = np.asfortranarray(obs)
+    assert np.all(env.observation(obs) == obs.flatten())
+
+
+@pytest.mark.parametrize("copy", [True, False])
+def test_vector_flatten_observation_copy(copy):
+    space = spaces.Dict(
+        {"a": spaces.Box(0, 1, shape=(2,)), "b": spaces.Box(0, 1, shape=(3, 2))}
+    )
+    envs = gym.vector.SyncVectorEnv(
+        [lambda: GenericTestEnv(observation_space=space) for _ in range(2)]
+    )
+    wrapped_envs = FlattenObservation(envs, copy=copy)
+
+    obs, _ = wrapped_envs.reset(seed=123)
+    reset_obs = obs.copy()
+    next_obs, _, _, _, _ = wrapped_envs.step(wrapped_envs.action_space.sample())
+
+    if copy:
+        assert obs is not next_obs
+        assert np.all(obs == reset_obs)
+    else:
+        # The observation array is reused, so is overwritten by the next step
+        assert obs is next_obs